@@ -14,10 +14,21 @@
 from __future__ import print_function, absolute_import
 
 import abc
+import asyncio
+import contextlib
 import datetime
-from typing import Any, Dict, Optional, Tuple, Union
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
 import logging
 
+import boto3
+import botocore.config
+
 from sagemaker.enums import EndpointType
 from sagemaker.deprecations import (
     deprecated_class,
@@ -53,6 +64,7 @@ from sagemaker.serializers import (
     NumpySerializer,
 )
 from sagemaker.session import production_variant, Session
+from sagemaker.user_agent import prepend_user_agent
 from sagemaker.utils import name_from_base, stringify_object
 
 from sagemaker.model_monitor.model_monitoring import DEFAULT_REPOSITORY_NAME
@@ -62,6 +74,133 @@ from sagemaker.compute_resource_requirements.resource_requirements import Resour
 
 LOGGER = logging.getLogger("sagemaker")
 
+# botocore's default for ``max_pool_connections``
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+# Upper bound on concurrent ``DeleteModel`` requests, kept within the default connection pool
+DELETE_MODEL_MAX_WORKERS = DEFAULT_MAX_POOL_CONNECTIONS
+
+# Upper bound on monitoring schedules attached concurrently by ``list_monitors``
+LIST_MONITORS_MAX_WORKERS = DEFAULT_MAX_POOL_CONNECTIONS
+
+# Environment variable that sets the connection pool size of the clients shared by predictors
+# created without a ``sagemaker_session``, in the spirit of botocore's ``max_pool_connections``.
+MAX_POOL_CONNECTIONS_ENV_NAME = "SAGEMAKER_MAX_POOL_CONNECTIONS"
+DEFAULT_SHARED_MAX_POOL_CONNECTIONS = 50
+
+# Request arguments that make an invocation non-idempotent, so its response is never cached.
+NON_CACHEABLE_REQUEST_ARGS = ("CustomAttributes", "InferenceId")
+
+
+_shared_session_clients: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
+_shared_session_clients_lock = threading.Lock()
+
+
+def _get_shared_session_clients() -> Dict[str, Any]:
+    """Get the boto3 session and clients shared by predictors created without a session.
+
+    The clients keep TCP connections alive and pool up to ``SAGEMAKER_MAX_POOL_CONNECTIONS``
+    connections (default: 50), so predictors used from many threads reuse connections
+    instead of opening new ones. They are created on first use, and created again when
+    the default boto3 session or its region changes.
+
+    Returns:
+        dict: The ``boto_session``, ``sagemaker_client`` and ``sagemaker_runtime_client``
+            keyword arguments for :class:`~sagemaker.session.Session`, or an empty dict
+            if no region is configured, so that :class:`~sagemaker.session.Session`
+            reports the missing region.
+    """
+    global _shared_session_clients  # pylint: disable=global-statement
+    with _shared_session_clients_lock:
+        default_session = boto3.DEFAULT_SESSION
+        if _shared_session_clients is not None:
+            (cached_default_session, cached_region), clients = _shared_session_clients
+            boto_session = default_session or clients["boto_session"]
+            if (
+                cached_default_session is default_session
+                and cached_region == boto_session.region_name
+            ):
+                return clients
+
+        boto_session = default_session or boto3.Session()
+        if boto_session.region_name is None:
+            return {}
+
+        max_pool_connections = int(
+            os.environ.get(MAX_POOL_CONNECTIONS_ENV_NAME, DEFAULT_SHARED_MAX_POOL_CONNECTIONS)
+        )
+        clients = {
+            "boto_session": boto_session,
+            "sagemaker_client": boto_session.client(
+                "sagemaker",
+                config=botocore.config.Config(
+                    max_pool_connections=max_pool_connections,
+                    tcp_keepalive=True,
+                    retries={"mode": "standard", "max_attempts": 5},
+                ),
+            ),
+            "sagemaker_runtime_client": boto_session.client(
+                "runtime.sagemaker",
+                config=botocore.config.Config(
+                    read_timeout=80,
+                    max_pool_connections=max_pool_connections,
+                    tcp_keepalive=True,
+                ),
+            ),
+        }
+        _shared_session_clients = ((default_session, boto_session.region_name), clients)
+        return clients
+
+
+class _PredictionCache(object):
+    """A thread-safe LRU cache of deserialized predictions."""
+
+    __slots__ = ("max_entries", "hits", "misses", "_entries", "_lock")
+
+    def __init__(self, max_entries: int):
+        """Initialize a ``_PredictionCache``.
+
+        Args:
+            max_entries (int): The maximum number of predictions to keep.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Look up a prediction, marking it as most recently used.
+
+        Returns:
+            Tuple[bool, Any]: Whether the key was found, and the cached prediction.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Hashable, prediction: Any):
+        """Store a prediction, evicting the least recently used one if the cache is full."""
+        with self._lock:
+            self._entries[key] = prediction
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss and entry counts of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
 
 class PredictorBase(abc.ABC):
     """An object that encapsulates a deployed model."""
@@ -89,9 +228,20 @@ class PredictorBase(abc.ABC):
         return stringify_object(self)
 
 
-class Predictor(PredictorBase):
+class Predictor(PredictorBase):  # pylint: disable=too-many-public-methods
     """Make prediction requests to an Amazon SageMaker endpoint."""
 
+    # ModelMonitor classes for the monitoring types of non-legacy schedules
+    _MONITOR_TYPE_MAP = {
+        "ModelBias": ModelBiasMonitor,
+        "ModelExplainability": ModelExplainabilityMonitor,
+        "DataQuality": DefaultModelMonitor,
+        "ModelQuality": ModelQualityMonitor,
+    }
+
+    # Whether the deprecated ``endpoint`` attribute has already been warned about
+    _endpoint_warned = False
+
     def __init__(
         self,
         endpoint_name,
@@ -99,6 +249,7 @@ class Predictor(PredictorBase):
         serializer=IdentitySerializer(),
         deserializer=BytesDeserializer(),
         component_name=None,
+        runtime_client_config: Optional[botocore.config.Config] = None,
         **kwargs,
     ):
         """Initialize a ``Predictor``.
@@ -115,7 +266,10 @@ class Predictor(PredictorBase):
             sagemaker_session (sagemaker.session.Session): A SageMaker Session
                 object, used for SageMaker interactions (default: None). If not
                 specified, one is created using the default AWS configuration
-                chain.
+                chain. Its SageMaker and SageMaker Runtime clients are shared by all
+                predictors created without a session, and pool up to the number of
+                connections set by the ``SAGEMAKER_MAX_POOL_CONNECTIONS`` environment
+                variable (default: 50).
             serializer (:class:`~sagemaker.serializers.BaseSerializer`): A
                 serializer object, used to encode data for an inference endpoint
                 (default: :class:`~sagemaker.serializers.IdentitySerializer`).
@@ -124,20 +278,46 @@ class Predictor(PredictorBase):
                 endpoint (default: :class:`~sagemaker.deserializers.BytesDeserializer`).
             component_name (str): Name of the Amazon SageMaker inference component
                 corresponding the predictor.
+            runtime_client_config (botocore.config.Config): Optional. Configuration for a
+                SageMaker Runtime client dedicated to this predictor (default: None). If
+                specified, it is merged into the configuration of the session's runtime
+                client, and the result is used to create the client that sends requests to
+                the endpoint. Each in-flight ``predict`` call holds one pooled connection,
+                so when calling ``predict`` from many threads, set ``max_pool_connections``
+                to at least the number of threads. Otherwise, calls beyond the pool size
+                wait for a free connection or open a new one. TCP keep-alive is enabled on
+                the client unless the configuration sets ``tcp_keepalive=False``. The client
+                is created again if ``sagemaker_session`` is replaced. Not supported in
+                local mode. If not specified, the session's runtime client is used.
         """
-        removed_kwargs("content_type", kwargs)
-        removed_kwargs("accept", kwargs)
-        endpoint_name = renamed_kwargs("endpoint", "endpoint_name", endpoint_name, kwargs)
+        if kwargs:
+            removed_kwargs("content_type", kwargs)
+            removed_kwargs("accept", kwargs)
+            endpoint_name = renamed_kwargs("endpoint", "endpoint_name", endpoint_name, kwargs)
         self.endpoint_name = endpoint_name
         self.component_name = component_name
-        self.sagemaker_session = sagemaker_session or Session()
+        self.sagemaker_session = sagemaker_session or Session(**_get_shared_session_clients())
+        self._content_type = None
+        self._accept = None
+        self._content_type_header = None
+        self._accept_header = None
         self.serializer = serializer
         self.deserializer = deserializer
+        self._endpoint_desc = None
         self._endpoint_config_name = None
         self._model_names = None
         self._context = None
-        self._content_type = None
-        self._accept = None
+        self._prediction_cache = None
+        self._jumpstart_payload_serializers: Dict[str, PayloadSerializer] = {}
+        self._async_runtime_client = None
+        self._async_runtime_client_stack = None
+        self._async_runtime_client_lock = None
+        self._async_runtime_client_credentials = None
+        self._async_runtime_client_loop = None
+        self._runtime_client_config = runtime_client_config
+        self._runtime_client = None
+        if runtime_client_config is not None:
+            self._runtime_client = self._create_runtime_client(runtime_client_config)
 
     def predict(
         self,
@@ -189,7 +369,31 @@ class Predictor(PredictorBase):
                 returned. Otherwise the response returns the sequence of bytes
                 as is.
         """
-        # [TODO]: clean up component_name in _create_request_args
+        if not (
+            initial_args
+            or target_model
+            or target_variant
+            or inference_id
+            or custom_attributes
+            or component_name
+            or self._prediction_cache is not None
+            or isinstance(data, JumpStartSerializablePayload)
+        ):
+            plan = self._get_fast_predict_plan()
+            if plan:
+                serialize, content_type, accept = plan
+                args = {
+                    "EndpointName": self.endpoint_name,
+                    "ContentType": content_type,
+                    "Accept": accept,
+                }
+                inference_component_name = self._get_component_name()
+                if inference_component_name:
+                    args["InferenceComponentName"] = inference_component_name
+                args["Body"] = serialize(data)
+                return self._handle_response(self._get_invoke_endpoint()(**args))
+
+        inference_component_name = component_name or self._get_component_name()
         request_args = self._create_request_args(
             data=data,
             initial_args=initial_args,
@@ -197,18 +401,371 @@ class Predictor(PredictorBase):
             target_variant=target_variant,
             inference_id=inference_id,
             custom_attributes=custom_attributes,
+            component_name=inference_component_name,
         )
+        return self._predict_with_request_args(request_args)
+
+    def predict_raw(
+        self,
+        body,
+        content_type: Optional[str] = None,
+        accept: Optional[str] = None,
+        initial_args=None,
+        target_model=None,
+        target_variant=None,
+        inference_id=None,
+        custom_attributes=None,
+        component_name: Optional[str] = None,
+    ):
+        """Return the inference for a request body that is already serialized.
+
+        The body is sent as is, without calling the predictor's serializer. This lets
+        callers serialize an input once and reuse the result, or send a binary encoding
+        instead of a slower text one. For example, a NumPy array can be sent as ``.npy``
+        bytes instead of being converted to JSON:
+
+        .. code-block:: python
+
+            buffer = io.BytesIO()
+            np.save(buffer, array)
+            predictor.predict_raw(buffer.getvalue(), content_type="application/x-npy")
+
+        The response is decoded with the predictor's deserializer, as in ``predict``.
+        See :meth:`~sagemaker.predictor.Predictor.predict` for more info about the other
+        parameters. Values in ``initial_args`` take precedence over ``content_type`` and
+        ``accept``.
 
+        Args:
+            body (bytes or str or file-like object): The request body.
+            content_type (str): Optional. The MIME type of ``body``. If not specified, the
+                predictor's ``content_type`` is used (default: None).
+            accept (str): Optional. The content type(s) expected in the response. If not
+                specified, the predictor's ``accept`` is used (default: None).
+
+        Returns:
+            object: Inference for the given request body.
+        """
+        request_args = self._build_request_args(
+            body=body,
+            content_type=content_type,
+            accept=accept,
+            initial_args=initial_args,
+            target_model=target_model,
+            target_variant=target_variant,
+            inference_id=inference_id,
+            custom_attributes=custom_attributes,
+            component_name=component_name or self._get_component_name(),
+        )
+        return self._predict_with_request_args(request_args)
+
+    def _predict_with_request_args(self, request_args):
+        """Invoke the endpoint, or use the prediction cache, and deserialize the response."""
+        cache_key = self._get_prediction_cache_key(request_args)
+        if cache_key is not None:
+            found, prediction = self._prediction_cache.get(cache_key)
+            if found:
+                return prediction
+
+        response = self._get_invoke_endpoint()(**request_args)
+        prediction = self._handle_response(response)
+
+        if cache_key is not None:
+            self._prediction_cache.put(cache_key, prediction)
+        return prediction
+
+    async def predict_async(
+        self,
+        data,
+        initial_args=None,
+        target_model=None,
+        target_variant=None,
+        inference_id=None,
+        custom_attributes=None,
+        component_name: Optional[str] = None,
+    ):
+        """Return the inference from the specified endpoint without blocking the event loop.
+
+        The request is sent with an ``aiobotocore`` SageMaker Runtime client, so many
+        concurrent invocations can be awaited from one event loop instead of one thread
+        per request. The client is created on the first call, in the region of the
+        predictor's session, and reused on the same event loop until ``close_async`` is
+        called. Requires the ``aiobotocore`` package.
+
+        This is unrelated to :class:`~sagemaker.predictor_async.AsyncPredictor`, which
+        makes requests to asynchronous inference endpoints.
+
+        See :meth:`~sagemaker.predictor.Predictor.predict` for more info about parameters.
+
+        Returns:
+            object: Inference for the given input. If a deserializer was specified when creating
+                the Predictor, the result of the deserializer is
+                returned. Otherwise the response returns the sequence of bytes
+                as is.
+        """
         inference_component_name = component_name or self._get_component_name()
-        if inference_component_name:
-            request_args["InferenceComponentName"] = inference_component_name
+        request_args = self._create_request_args(
+            data=data,
+            initial_args=initial_args,
+            target_model=target_model,
+            target_variant=target_variant,
+            inference_id=inference_id,
+            custom_attributes=custom_attributes,
+            component_name=inference_component_name,
+        )
+
+        runtime_client = await self._get_async_runtime_client()
+        response = await runtime_client.invoke_endpoint(**request_args)
+        async with response["Body"] as stream:
+            response_body = await stream.read()
+
+        return self._handle_response(
+            {
+                "Body": io.BytesIO(response_body),
+                "ContentType": response.get("ContentType", "application/octet-stream"),
+            }
+        )
+
+    async def close_async(self):
+        """Close the ``aiobotocore`` clients used by ``predict_async``, if any were created.
+
+        Must be awaited on the event loop that ran ``predict_async``.
+        """
+        if self._async_runtime_client_stack is not None:
+            await self._async_runtime_client_stack.aclose()
+        self._async_runtime_client_stack = None
+        self._async_runtime_client = None
+        self._async_runtime_client_credentials = None
+        self._async_runtime_client_lock = None
+        self._async_runtime_client_loop = None
+
+    async def _get_async_runtime_client(self):
+        """Get the ``aiobotocore`` SageMaker Runtime client, creating it on first use.
+
+        The client and the lock guarding its creation belong to the running event loop,
+        so new ones are created when ``predict_async`` runs on another loop, such as in a
+        later ``asyncio.run`` call. The client is given a copy of the boto3 session's
+        credentials, so a new client is also created when those credentials are
+        refreshed. Replaced clients stay open, for requests still in flight on them,
+        until ``close_async`` is called.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_runtime_client_loop is not loop:
+            self._async_runtime_client = None
+            self._async_runtime_client_stack = None
+            self._async_runtime_client_credentials = None
+            self._async_runtime_client_lock = asyncio.Lock()
+            self._async_runtime_client_loop = loop
+
+        # Refreshes temporary credentials that are about to expire.
+        credentials = self.sagemaker_session.boto_session.get_credentials()
+        if credentials is not None:
+            credentials = credentials.get_frozen_credentials()
+        if (
+            self._async_runtime_client is not None
+            and credentials == self._async_runtime_client_credentials
+        ):
+            return self._async_runtime_client
+
+        async with self._async_runtime_client_lock:
+            if (
+                self._async_runtime_client is None
+                or credentials != self._async_runtime_client_credentials
+            ):
+                self._async_runtime_client = await self._create_async_runtime_client(credentials)
+                self._async_runtime_client_credentials = credentials
+        return self._async_runtime_client
+
+    async def _create_async_runtime_client(self, credentials):
+        """Create an ``aiobotocore`` SageMaker Runtime client like the boto3 one.
+
+        Args:
+            credentials (botocore.credentials.ReadOnlyCredentials): The credentials to
+                sign requests with, or None to use aiobotocore's credential chain.
+
+        Returns:
+            aiobotocore.client.AioBaseClient: The SageMaker Runtime client, which is closed
+                by ``close_async``.
+        """
+        runtime_client = self._get_runtime_client()
+        if getattr(runtime_client, "meta", None) is None:
+            raise ValueError("predict_async is not supported in local mode.")
+
+        try:
+            from aiobotocore.session import get_session
+        except ImportError as e:
+            raise ImportError(
+                "predict_async requires the aiobotocore package. "
+                "Install it with: pip install aiobotocore"
+            ) from e
+
+        credential_kwargs = {}
+        if credentials is not None:
+            credential_kwargs = {
+                "aws_access_key_id": credentials.access_key,
+                "aws_secret_access_key": credentials.secret_key,
+                "aws_session_token": credentials.token,
+            }
+
+        if self._async_runtime_client_stack is None:
+            self._async_runtime_client_stack = contextlib.AsyncExitStack()
+        return await self._async_runtime_client_stack.enter_async_context(
+            get_session().create_client(
+                "sagemaker-runtime",
+                region_name=self.sagemaker_session.boto_region_name,
+                endpoint_url=runtime_client.meta.endpoint_url,
+                config=botocore.config.Config(read_timeout=80),
+                **credential_kwargs,
+            )
+        )
+
+    def enable_prediction_cache(self, max_entries: int = 1024):
+        """Cache the predictions returned for repeated, identical requests.
+
+        Once enabled, ``predict`` returns the cached prediction, without invoking the
+        endpoint, when the serialized request body and all other request arguments
+        (endpoint, content types, target model, target variant and inference component)
+        match those of a recent request. Requests with ``inference_id`` or
+        ``custom_attributes`` are never cached. Only enable the cache for endpoints that
+        return the same prediction for the same input.
+
+        Cached predictions are returned as is, so callers must not modify them.
+        Responses decoded by a
+        :class:`~sagemaker.deserializers.StreamDeserializer` are not cached.
+
+        Args:
+            max_entries (int): The maximum number of predictions to cache. The least
+                recently used prediction is evicted when the cache is full
+                (default: 1024).
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1. Got {max_entries}.")
+        self._prediction_cache = _PredictionCache(max_entries)
+
+    def disable_prediction_cache(self):
+        """Stop caching predictions and discard the cached ones."""
+        self._prediction_cache = None
 
-        response = self.sagemaker_session.sagemaker_runtime_client.invoke_endpoint(**request_args)
-        return self._handle_response(response)
+    def prediction_cache_stats(self) -> Optional[Dict[str, int]]:
+        """Return the ``hits``, ``misses``, ``entries`` and ``max_entries`` of the cache.
+
+        Returns:
+            Optional[Dict[str, int]]: The cache statistics, or None if the prediction
+                cache is not enabled.
+        """
+        if self._prediction_cache is None:
+            return None
+        return self._prediction_cache.stats()
+
+    def _get_prediction_cache_key(self, request_args) -> Optional[Hashable]:
+        """Build the prediction cache key for a request, or None if it must not be cached."""
+        if self._prediction_cache is None or isinstance(self.deserializer, StreamDeserializer):
+            return None
+
+        body = request_args.get("Body")
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if not isinstance(body, (bytes, bytearray)):
+            return None
+
+        other_args = []
+        for key, value in request_args.items():
+            if key == "Body":
+                continue
+            if key in NON_CACHEABLE_REQUEST_ARGS or not isinstance(value, Hashable):
+                return None
+            other_args.append((key, value))
+
+        return tuple(sorted(other_args)), hashlib.blake2b(body, digest_size=16).digest()
+
+    def _create_runtime_client(self, runtime_client_config):
+        """Create a SageMaker Runtime client dedicated to this predictor.
+
+        Args:
+            runtime_client_config (botocore.config.Config): Configuration merged into the
+                configuration of the session's runtime client.
+
+        Returns:
+            botocore.client.BaseClient: The SageMaker Runtime client.
+        """
+        if self.sagemaker_session.local_mode:
+            raise ValueError("runtime_client_config is not supported in local mode.")
+
+        config = botocore.config.Config(tcp_keepalive=True)
+        session_runtime_client = self.sagemaker_session.sagemaker_runtime_client
+        session_config = getattr(getattr(session_runtime_client, "meta", None), "config", None)
+        if isinstance(session_config, botocore.config.Config):
+            config = config.merge(session_config)
+        runtime_client_config = config.merge(runtime_client_config)
+
+        runtime_client = self.sagemaker_session.boto_session.client(
+            "runtime.sagemaker", config=runtime_client_config
+        )
+        prepend_user_agent(runtime_client)
+        return runtime_client
+
+    def _check_runtime_client_pool_size(self, runtime_client):
+        """Log a hint if the session's runtime client uses botocore's default pool size."""
+        session_config = getattr(getattr(runtime_client, "meta", None), "config", None)
+        max_pool_connections = getattr(session_config, "max_pool_connections", None)
+        if (
+            isinstance(max_pool_connections, int)
+            and max_pool_connections <= DEFAULT_MAX_POOL_CONNECTIONS
+        ):
+            LOGGER.debug(
+                "The SageMaker Runtime client for endpoint %s allows %s pooled connections. "
+                "Concurrent predict calls beyond this wait for a free connection. Pass "
+                "runtime_client_config=botocore.config.Config(max_pool_connections=N), with N "
+                "at least the expected number of concurrent callers, to raise the limit.",
+                self.endpoint_name,
+                max_pool_connections,
+            )
+
+    def predict_stream(
+        self,
+        data,
+        initial_args=None,
+        target_model=None,
+        target_variant=None,
+        inference_id=None,
+        custom_attributes=None,
+        component_name: Optional[str] = None,
+    ):
+        """Return the unread response body of an inference from the specified endpoint.
+
+        Unlike ``predict``, the response body is not read or deserialized, so large
+        responses can be consumed incrementally instead of being held in memory in
+        full. It is the caller's responsibility to close the stream once they're done
+        reading it.
+
+        See :meth:`~sagemaker.predictor.Predictor.predict` for more info about parameters.
+
+        Returns:
+            tuple: A two-tuple containing the response body stream
+                (``botocore.response.StreamingBody``) and the MIME type of the data.
+        """
+        inference_component_name = component_name or self._get_component_name()
+        request_args = self._create_request_args(
+            data=data,
+            initial_args=initial_args,
+            target_model=target_model,
+            target_variant=target_variant,
+            inference_id=inference_id,
+            custom_attributes=custom_attributes,
+            component_name=inference_component_name,
+        )
+
+        response = self._get_invoke_endpoint()(**request_args)
+        return response["Body"], response.get("ContentType", "application/octet-stream")
 
     def _handle_response(self, response):
         """Placeholder docstring"""
         response_body = response["Body"]
+        # The default deserializer ignores the content type, so read the body directly.
+        if type(self.deserializer) is BytesDeserializer:  # pylint: disable=unidiomatic-typecheck
+            try:
+                return response_body.read()
+            finally:
+                response_body.close()
         content_type = response.get("ContentType", "application/octet-stream")
         return self.deserializer.deserialize(response_body, content_type)
 
@@ -220,6 +777,7 @@ class Predictor(PredictorBase):
         target_variant=None,
         inference_id=None,
         custom_attributes=None,
+        component_name=None,
     ):
         """Placeholder docstring"""
 
@@ -228,61 +786,71 @@ class Predictor(PredictorBase):
         jumpstart_content_type: Optional[str] = None
 
         if isinstance(data, JumpStartSerializablePayload):
-            s3_client = self.sagemaker_session.s3_client
-            region = self.sagemaker_session._region_name
-            bucket = get_jumpstart_content_bucket(region)
-
-            jumpstart_serialized_data = PayloadSerializer(
-                bucket=bucket, region=region, s3_client=s3_client
-            ).serialize(data)
+            jumpstart_serialized_data = self._get_jumpstart_payload_serializer().serialize(data)
             jumpstart_content_type = data.content_type
             jumpstart_accept = data.accept
 
-        args = dict(initial_args) if initial_args else {}
-
-        if "EndpointName" not in args:
-            args["EndpointName"] = self.endpoint_name
-
-        if "ContentType" not in args:
-            if isinstance(data, JumpStartSerializablePayload) and jumpstart_content_type:
-                args["ContentType"] = jumpstart_content_type
-            else:
-                args["ContentType"] = (
-                    self.content_type
-                    if isinstance(self.content_type, str)
-                    else ", ".join(self.content_type)
-                )
-
-        if "Accept" not in args:
-            if isinstance(data, JumpStartSerializablePayload) and jumpstart_accept:
-                args["Accept"] = jumpstart_accept
-            else:
-                args["Accept"] = (
-                    self.accept if isinstance(self.accept, str) else ", ".join(self.accept)
-                )
-
-        if target_model:
-            args["TargetModel"] = target_model
-
-        if target_variant:
-            args["TargetVariant"] = target_variant
+        return self._build_request_args(
+            body=jumpstart_serialized_data or self.serializer.serialize(data),
+            content_type=jumpstart_content_type,
+            accept=jumpstart_accept,
+            initial_args=initial_args,
+            target_model=target_model,
+            target_variant=target_variant,
+            inference_id=inference_id,
+            custom_attributes=custom_attributes,
+            component_name=component_name,
+        )
 
-        if inference_id:
-            args["InferenceId"] = inference_id
+    def _build_request_args(
+        self,
+        body,
+        content_type=None,
+        accept=None,
+        initial_args=None,
+        target_model=None,
+        target_variant=None,
+        inference_id=None,
+        custom_attributes=None,
+        component_name=None,
+    ):
+        """Build the ``invoke_endpoint`` arguments for an already serialized request body."""
+        # Values from initial_args take precedence over the predictor defaults.
+        args = {
+            "EndpointName": self.endpoint_name,
+            "ContentType": content_type or self._get_content_type_header(),
+            "Accept": accept or self._get_accept_header(),
+            **(initial_args or {}),
+        }
 
-        if custom_attributes:
-            args["CustomAttributes"] = custom_attributes
+        for key, value in (
+            ("TargetModel", target_model),
+            ("TargetVariant", target_variant),
+            ("InferenceId", inference_id),
+            ("CustomAttributes", custom_attributes),
+            ("InferenceComponentName", component_name),
+        ):
+            if value:
+                args[key] = value
+
+        args["Body"] = body
+        return args
 
-        data = (
-            jumpstart_serialized_data
-            if isinstance(data, JumpStartSerializablePayload) and jumpstart_serialized_data
-            else self.serializer.serialize(data)
-        )
-        if self._get_component_name():
-            args["InferenceComponentName"] = self.component_name
+    def _get_jumpstart_payload_serializer(self) -> PayloadSerializer:
+        """Get the JumpStart payload serializer for the session's region and S3 client.
 
-        args["Body"] = data
-        return args
+        The serializer, and the content bucket lookup it needs, are created once per region
+        and reused by later requests.
+        """
+        s3_client = self.sagemaker_session.s3_client
+        region = self.sagemaker_session._region_name
+        payload_serializer = self._jumpstart_payload_serializers.get(region)
+        if payload_serializer is None or payload_serializer.s3_client is not s3_client:
+            payload_serializer = PayloadSerializer(
+                bucket=get_jumpstart_content_bucket(region), region=region, s3_client=s3_client
+            )
+            self._jumpstart_payload_serializers[region] = payload_serializer
+        return payload_serializer
 
     def update_endpoint(
         self,
@@ -351,22 +919,16 @@ class Predictor(PredictorBase):
             if instance_type is None or initial_instance_count is None:
                 raise ValueError(
                     "Missing initial_instance_count and/or instance_type. Provided values: "
-                    "initial_instance_count={}, instance_type={}, accelerator_type={}, "
-                    "model_name={}.".format(
-                        initial_instance_count,
-                        instance_type,
-                        accelerator_type,
-                        model_name,
-                    )
+                    f"initial_instance_count={initial_instance_count}, "
+                    f"instance_type={instance_type}, accelerator_type={accelerator_type}, "
+                    f"model_name={model_name}."
                 )
 
             if model_name is None:
                 if len(current_model_names) > 1:
                     raise ValueError(
                         "Unable to choose a default model for a new EndpointConfig because "
-                        "the endpoint has multiple models: {}".format(
-                            ", ".join(current_model_names)
-                        )
+                        f"the endpoint has multiple models: {', '.join(current_model_names)}"
                     )
                 model_name = current_model_names[0]
             else:
@@ -378,21 +940,14 @@ class Predictor(PredictorBase):
             if min_instance_count:
                 managed_instance_scaling["MinInstanceCount"] = min_instance_count
 
-            if managed_instance_scaling and len(managed_instance_scaling) > 0:
-                production_variant_config = production_variant(
-                    model_name,
-                    instance_type,
-                    initial_instance_count=initial_instance_count,
-                    accelerator_type=accelerator_type,
-                    managed_instance_scaling=managed_instance_scaling,
-                )
-            else:
-                production_variant_config = production_variant(
-                    model_name,
-                    instance_type,
-                    initial_instance_count=initial_instance_count,
-                    accelerator_type=accelerator_type,
-                )
+            pv_kwargs = {
+                "initial_instance_count": initial_instance_count,
+                "accelerator_type": accelerator_type,
+            }
+            if managed_instance_scaling:
+                pv_kwargs["managed_instance_scaling"] = managed_instance_scaling
+
+            production_variant_config = production_variant(model_name, instance_type, **pv_kwargs)
             production_variants = [production_variant_config]
 
         current_endpoint_config_name = self._get_endpoint_config_name()
@@ -415,6 +970,7 @@ class Predictor(PredictorBase):
         self.sagemaker_session.update_endpoint(
             self.endpoint_name, new_endpoint_config_name, wait=wait
         )
+        self._endpoint_desc = None
         self._endpoint_config_name = new_endpoint_config_name
 
     def _delete_endpoint_config(self):
@@ -438,6 +994,7 @@ class Predictor(PredictorBase):
             self._delete_endpoint_config()
 
         self.sagemaker_session.delete_endpoint(self.endpoint_name)
+        self._endpoint_desc = None
 
     def delete_predictor(self, wait: bool = False) -> None:
         """Delete the Amazon SageMaker inference component or endpoint backing this predictor.
@@ -521,7 +1078,7 @@ class Predictor(PredictorBase):
             if model_data:
                 request["specification"]["Container"]["ArtifactUrl"] = model_data
 
-        if resources.copy_count:
+        if resources and resources.copy_count:
             request["runtime_config"] = {"CopyCount": resources.copy_count}
 
         if model_data_download_timeout:
@@ -534,13 +1091,9 @@ class Predictor(PredictorBase):
                 "ContainerStartupHealthCheckTimeoutInSeconds"
             ] = container_startup_health_check_timeout
 
-        if "specification" in request:
-            empty_keys = []
-            for key, value in request["specification"].items():
-                if not value:
-                    empty_keys.append(key)
-            for key in empty_keys:
-                del request["specification"][key]
+        request["specification"] = {
+            key: value for key, value in request["specification"].items() if value
+        }
 
         self.sagemaker_session.update_inference_component(**request)
 
@@ -626,22 +1179,71 @@ class Predictor(PredictorBase):
 
         return inference_components, next_token_from_response
 
+    def iter_related_models(self, prefetch: bool = True, **kwargs):
+        """Iterate over the deployed models co-located with this predictor.
+
+        Calls SageMaker:ListInferenceComponents on the endpoint associated with the
+        predictor, following pagination tokens until all results are returned. Unlike
+        ``list_related_models``, pages are fetched as the iterator is consumed.
+
+        Args:
+            prefetch (bool): Optional. Whether to request the next page in a background
+                thread while the items of the current page are consumed (default: True).
+            **kwargs: Filter and sort arguments for the listing, such as ``status_equals``
+                or ``sort_by``. See :meth:`~sagemaker.predictor.Predictor.list_related_models`
+                for the supported arguments. If ``next_token`` is given, iteration resumes
+                from that page.
+
+        Yields:
+            Dict[str, Any]: An Amazon SageMaker inference component object associated with
+                the endpoint.
+        """
+        next_token = kwargs.pop("next_token", None)
+
+        def list_page(token):
+            return self.sagemaker_session.list_inference_components(
+                endpoint_name_equals=self.endpoint_name, next_token=token, **kwargs
+            )
+
+        with contextlib.ExitStack() as stack:
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=1)) if prefetch else None
+            response = list_page(next_token)
+            while True:
+                next_token = response.get("NextToken")
+                next_page = None
+                if next_token and executor is not None:
+                    next_page = executor.submit(list_page, next_token)
+
+                yield from response.get("InferenceComponents", [])
+
+                if not next_token:
+                    return
+                response = next_page.result() if next_page else list_page(next_token)
+
     def delete_model(self):
-        """Delete the Amazon SageMaker model backing this predictor."""
-        request_failed = False
-        failed_models = []
-        current_model_names = self._get_model_names()
-        for model_name in current_model_names:
-            try:
-                self.sagemaker_session.delete_model(model_name)
-            except Exception:  # pylint: disable=broad-except
-                request_failed = True
-                failed_models.append(model_name)
+        """Delete the Amazon SageMaker model backing this predictor.
 
-        if request_failed:
+        When the endpoint is backed by more than one model, the models are deleted
+        concurrently.
+        """
+        current_model_names = self._get_model_names()
+        if not current_model_names:
+            return
+
+        max_workers = min(DELETE_MODEL_MAX_WORKERS, len(current_model_names))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                model_name: executor.submit(self.sagemaker_session.delete_model, model_name)
+                for model_name in current_model_names
+            }
+        failed_models = [
+            model_name for model_name, future in futures.items() if future.exception() is not None
+        ]
+
+        if failed_models:
             raise Exception(
                 "One or more models cannot be deleted, please retry. \n"
-                "Failed models: {}".format(", ".join(failed_models))
+                f"Failed models: {', '.join(failed_models)}"
             )
 
     def enable_data_capture(self):
@@ -679,10 +1281,7 @@ class Predictor(PredictorBase):
             data_capture_config (sagemaker.model_monitor.DataCaptureConfig): The
                 DataCaptureConfig to update the predictor's endpoint to use.
         """
-        endpoint_desc = self.sagemaker_session.sagemaker_client.describe_endpoint(
-            EndpointName=self.endpoint_name
-        )
-
+        existing_config_name = self._describe_endpoint(force=True)["EndpointConfigName"]
         new_config_name = name_from_base(base=self.endpoint_name)
 
         data_capture_config_dict = None
@@ -690,7 +1289,7 @@ class Predictor(PredictorBase):
             data_capture_config_dict = data_capture_config._to_request_dict()
 
         self.sagemaker_session.create_endpoint_config_from_existing(
-            existing_config_name=endpoint_desc["EndpointConfigName"],
+            existing_config_name=existing_config_name,
             new_config_name=new_config_name,
             new_data_capture_config_dict=data_capture_config_dict,
         )
@@ -698,6 +1297,8 @@ class Predictor(PredictorBase):
         self.sagemaker_session.update_endpoint(
             endpoint_name=self.endpoint_name, endpoint_config_name=new_config_name
         )
+        self._endpoint_desc = None
+        self._endpoint_config_name = new_config_name
 
     def list_monitors(self):
         """Generates ModelMonitor objects (or DefaultModelMonitors).
@@ -714,22 +1315,24 @@ class Predictor(PredictorBase):
             endpoint_name=self.endpoint_name
         )
         if len(monitoring_schedules_dict["MonitoringScheduleSummaries"]) == 0:
-            print("No monitors found for endpoint. endpoint: {}".format(self.endpoint_name))
+            LOGGER.info("No monitors found for endpoint. endpoint: %s", self.endpoint_name)
             return []
 
-        monitors = []
-        for schedule_dict in monitoring_schedules_dict["MonitoringScheduleSummaries"]:
-            schedule_name = schedule_dict["MonitoringScheduleName"]
-            monitoring_type = schedule_dict.get("MonitoringType")
-            clazz = self._get_model_monitor_class(schedule_name, monitoring_type)
-            monitors.append(
-                clazz.attach(
-                    monitor_schedule_name=schedule_name,
-                    sagemaker_session=self.sagemaker_session,
-                )
-            )
-
-        return monitors
+        schedule_summaries = monitoring_schedules_dict["MonitoringScheduleSummaries"]
+        max_workers = min(LIST_MONITORS_MAX_WORKERS, len(schedule_summaries))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map yields the monitors in schedule order and re-raises the first failure.
+            return list(executor.map(self._attach_monitor, schedule_summaries))
+
+    def _attach_monitor(self, schedule_dict):
+        """Attach a ModelMonitor to a schedule from a ListMonitoringSchedules summary."""
+        schedule_name = schedule_dict["MonitoringScheduleName"]
+        monitoring_type = schedule_dict.get("MonitoringType")
+        clazz = self._get_model_monitor_class(schedule_name, monitoring_type)
+        return clazz.attach(
+            monitor_schedule_name=schedule_name,
+            sagemaker_session=self.sagemaker_session,
+        )
 
     def _get_model_monitor_class(self, schedule_name, monitoring_type):
         """Decide which ModelMonitor class the given schedule should attach to
@@ -744,29 +1347,24 @@ class Predictor(PredictorBase):
         Raises:
             TypeError: If the class could not be decided (due to unknown monitoring type).
         """
-        if monitoring_type == "ModelBias":
-            clazz = ModelBiasMonitor
-        elif monitoring_type == "ModelExplainability":
-            clazz = ModelExplainabilityMonitor
-        else:
-            schedule = self.sagemaker_session.describe_monitoring_schedule(
-                monitoring_schedule_name=schedule_name
-            )
-            embedded_job_definition = schedule["MonitoringScheduleConfig"].get(
-                "MonitoringJobDefinition"
-            )
-            if embedded_job_definition is not None:  # legacy v1 schedule
-                image_uri = embedded_job_definition["MonitoringAppSpecification"]["ImageUri"]
-                if image_uri.endswith(DEFAULT_REPOSITORY_NAME):
-                    clazz = DefaultModelMonitor
-                else:
-                    clazz = ModelMonitor
-            elif monitoring_type == "DataQuality":
-                clazz = DefaultModelMonitor
-            elif monitoring_type == "ModelQuality":
-                clazz = ModelQualityMonitor
-            else:
-                raise TypeError("Unknown monitoring type: {}".format(monitoring_type))
+        # Only data and model quality schedules can be legacy v1 schedules, which
+        # need to be described to find their class.
+        if monitoring_type in ("ModelBias", "ModelExplainability"):
+            return self._MONITOR_TYPE_MAP[monitoring_type]
+
+        schedule = self.sagemaker_session.describe_monitoring_schedule(
+            monitoring_schedule_name=schedule_name
+        )
+        job_definition = schedule["MonitoringScheduleConfig"].get("MonitoringJobDefinition")
+        if job_definition is not None:  # legacy v1 schedule
+            image_uri = job_definition["MonitoringAppSpecification"]["ImageUri"]
+            if image_uri.endswith(DEFAULT_REPOSITORY_NAME):
+                return DefaultModelMonitor
+            return ModelMonitor
+
+        clazz = self._MONITOR_TYPE_MAP.get(monitoring_type)
+        if clazz is None:
+            raise TypeError(f"Unknown monitoring type: {monitoring_type}")
         return clazz
 
     def endpoint_context(self):
@@ -787,64 +1385,191 @@ class Predictor(PredictorBase):
             return self._context
 
         # retrieve endpoint by name to get arn
-        response = self.sagemaker_session.sagemaker_client.describe_endpoint(
-            EndpointName=self.endpoint_name
-        )
-        endpoint_arn = response["EndpointArn"]
+        endpoint_arn = self._describe_endpoint()["EndpointArn"]
 
-        # list context by source uri using arn
-        contexts = list(
-            EndpointContext.list(sagemaker_session=self.sagemaker_session, source_uri=endpoint_arn)
+        # list context by source uri using arn, only fetching the first one
+        context_summaries = EndpointContext.list(
+            sagemaker_session=self.sagemaker_session, source_uri=endpoint_arn, max_results=1
         )
+        context_summary = next(context_summaries, None)
 
-        if len(contexts) != 0:
+        if context_summary is not None:
             # create endpoint context object
             self._context = EndpointContext.load(
                 sagemaker_session=self.sagemaker_session,
-                context_name=contexts[0].context_name,
+                context_name=context_summary.context_name,
             )
 
         return self._context
 
     def _get_endpoint_config_name(self):
-        """Placeholder docstring"""
+        """Get the name of the endpoint's current config, describing the endpoint once."""
         if self._endpoint_config_name is not None:
             return self._endpoint_config_name
-        endpoint_desc = self.sagemaker_session.sagemaker_client.describe_endpoint(
-            EndpointName=self.endpoint_name
-        )
-        self._endpoint_config_name = endpoint_desc["EndpointConfigName"]
+        self._endpoint_config_name = self._describe_endpoint()["EndpointConfigName"]
         return self._endpoint_config_name
 
+    def _describe_endpoint(self, force=False):
+        """Describe the endpoint, reusing the last response unless ``force`` is set.
+
+        The response is dropped when this predictor updates or deletes the endpoint.
+
+        Args:
+            force (bool): Whether to call SageMaker:DescribeEndpoint even if a response
+                is cached (default: False).
+
+        Returns:
+            dict: The DescribeEndpoint response.
+        """
+        if force or self._endpoint_desc is None:
+            self._endpoint_desc = self.sagemaker_session.sagemaker_client.describe_endpoint(
+                EndpointName=self.endpoint_name
+            )
+        return self._endpoint_desc
+
     def _get_model_names(self):
-        """Placeholder docstring"""
+        """Get the names of the models behind the predictor, describing them once.
+
+        The names are only memoized once they are fetched, so a failed describe call
+        is retried on the next call.
+        """
         if self._model_names is not None:
             return self._model_names
-        self._model_names = []
 
         # If the predictor is for Inference Component, return the model behind the
         # Inference Component. Otherwise, fetch all models behind the Endpoint
         component_name = self._get_component_name()
         if component_name:
             desc = self.sagemaker_session.describe_inference_component(component_name)
-            if "Specification" in desc and "ModelName" in desc["Specification"]:
-                self._model_names.append(desc["Specification"]["ModelName"])
+            model_name = desc.get("Specification", {}).get("ModelName")
+            self._model_names = [model_name] if model_name else []
             return self._model_names
 
         current_endpoint_config_name = self._get_endpoint_config_name()
         endpoint_config = self.sagemaker_session.sagemaker_client.describe_endpoint_config(
             EndpointConfigName=current_endpoint_config_name
         )
-        production_variants = endpoint_config["ProductionVariants"]
-        for d in production_variants:
-            if "ModelName" in d:
-                self._model_names.append(d["ModelName"])
+        self._model_names = [
+            d["ModelName"] for d in endpoint_config["ProductionVariants"] if "ModelName" in d
+        ]
         return self._model_names
 
     def _get_component_name(self) -> Optional[str]:
         """Get the inference component name field if it exists in the Predictor object."""
         return getattr(self, "component_name", None)
 
+    def _get_runtime_client(self):
+        """Get the SageMaker Runtime client that sends requests to the endpoint.
+
+        This is the client created from ``runtime_client_config``, if one was given,
+        or else the session's runtime client.
+        """
+        if self._runtime_client_config is None:
+            return self.sagemaker_session.sagemaker_runtime_client
+        if self._runtime_client is None:
+            self._runtime_client = self._create_runtime_client(self._runtime_client_config)
+        return self._runtime_client
+
+    def _get_invoke_endpoint(self):
+        """Get the runtime client's bound ``invoke_endpoint`` method.
+
+        The bound method is reused until the runtime client is replaced.
+        """
+        runtime_client = self._get_runtime_client()
+        if self._invoke_endpoint is None or runtime_client is not self._invoke_endpoint_client:
+            if self._runtime_client_config is None:
+                self._check_runtime_client_pool_size(runtime_client)
+            self._invoke_endpoint = runtime_client.invoke_endpoint
+            self._invoke_endpoint_client = runtime_client
+        return self._invoke_endpoint
+
+    def _get_fast_predict_plan(self) -> tuple:
+        """Get the serializer and headers used by ``predict`` for plain requests.
+
+        ``predict`` calls without routing arguments, custom attributes or a JumpStart
+        payload always serialize the data with the same serializer and send the same
+        headers, so these are resolved once and reused until the session, serializer,
+        deserializer, content type or accept is changed.
+
+        Returns:
+            tuple: The serializer's ``serialize`` method and the ``ContentType`` and
+                ``Accept`` headers, or an empty tuple if a subclass customizes how request
+                arguments are built or sent.
+        """
+        if self._fast_predict_plan is None:
+            customized = any(
+                getattr(getattr(self, name), "__func__", None) is not getattr(Predictor, name)
+                for name in (
+                    "_create_request_args",
+                    "_build_request_args",
+                    "_predict_with_request_args",
+                )
+            )
+            self._fast_predict_plan = (
+                ()
+                if customized
+                else (
+                    self.serializer.serialize,
+                    self._get_content_type_header(),
+                    self._get_accept_header(),
+                )
+            )
+        return self._fast_predict_plan
+
+    def _get_content_type_header(self) -> str:
+        """Get the ``ContentType`` request header, joining multiple values once and caching it."""
+        if self._content_type_header is None:
+            content_type = self.content_type
+            self._content_type_header = (
+                content_type if isinstance(content_type, str) else ", ".join(content_type)
+            )
+        return self._content_type_header
+
+    def _get_accept_header(self) -> str:
+        """Get the ``Accept`` request header, joining multiple values once and caching it."""
+        if self._accept_header is None:
+            accept = self.accept
+            self._accept_header = accept if isinstance(accept, str) else ", ".join(accept)
+        return self._accept_header
+
+    @property
+    def sagemaker_session(self):
+        """The SageMaker Session used for SageMaker interactions."""
+        return self._sagemaker_session
+
+    @sagemaker_session.setter
+    def sagemaker_session(self, val):
+        """Set the SageMaker Session used for SageMaker interactions."""
+        self._sagemaker_session = val
+        self._runtime_client = None
+        self._invoke_endpoint = None
+        self._invoke_endpoint_client = None
+        self._fast_predict_plan = None
+
+    @property
+    def serializer(self):
+        """The serializer used to encode data for the inference endpoint."""
+        return self._serializer
+
+    @serializer.setter
+    def serializer(self, val):
+        """Set the serializer used to encode data for the inference endpoint."""
+        self._serializer = val
+        self._content_type_header = None
+        self._fast_predict_plan = None
+
+    @property
+    def deserializer(self):
+        """The deserializer used to decode data from the inference endpoint."""
+        return self._deserializer
+
+    @deserializer.setter
+    def deserializer(self, val):
+        """Set the deserializer used to decode data from the inference endpoint."""
+        self._deserializer = val
+        self._accept_header = None
+        self._fast_predict_plan = None
+
     @property
     def content_type(self):
         """The MIME type of the data sent to the inference endpoint."""
@@ -859,23 +1584,43 @@ class Predictor(PredictorBase):
     def content_type(self, val: str):
         """Set the MIME type of the data sent to the inference endpoint."""
         self._content_type = val
+        self._content_type_header = None
+        self._fast_predict_plan = None
 
     @accept.setter
     def accept(self, val: str):
         """Set the content type(s) that are expected from the inference endpoint."""
         self._accept = val
+        self._accept_header = None
+        self._fast_predict_plan = None
 
     @property
     def endpoint(self):
-        """Deprecated attribute. Please use endpoint_name."""
-        renamed_warning("The endpoint attribute")
+        """Deprecated attribute. Please use endpoint_name.
+
+        The deprecation warning is only emitted for the first access in the process.
+        """
+        if not Predictor._endpoint_warned:
+            Predictor._endpoint_warned = True
+            renamed_warning("The endpoint attribute")
         return self.endpoint_name
 
 
-csv_serializer = deprecated_serialize(CSVSerializer(), "csv_serializer")
-json_serializer = deprecated_serialize(JSONSerializer(), "json_serializer")
-npy_serializer = deprecated_serialize(NumpySerializer(), "npy_serializer")
-csv_deserializer = deprecated_deserialize(CSVDeserializer(), "csv_deserializer")
-json_deserializer = deprecated_deserialize(JSONDeserializer(), "json_deserializer")
-numpy_deserializer = deprecated_deserialize(NumpyDeserializer(), "numpy_deserializer")
-RealTimePredictor = deprecated_class(Predictor, "RealTimePredictor")
+# Deprecated module attributes, created on first access by ``__getattr__``
+_DEPRECATED_ATTRIBUTE_FACTORIES = {
+    "csv_serializer": lambda: deprecated_serialize(CSVSerializer(), "csv_serializer"),
+    "json_serializer": lambda: deprecated_serialize(JSONSerializer(), "json_serializer"),
+    "npy_serializer": lambda: deprecated_serialize(NumpySerializer(), "npy_serializer"),
+    "csv_deserializer": lambda: deprecated_deserialize(CSVDeserializer(), "csv_deserializer"),
+    "json_deserializer": lambda: deprecated_deserialize(JSONDeserializer(), "json_deserializer"),
+    "numpy_deserializer": lambda: deprecated_deserialize(NumpyDeserializer(), "numpy_deserializer"),
+    "RealTimePredictor": lambda: deprecated_class(Predictor, "RealTimePredictor"),
+}
+
+
+def __getattr__(name):
+    """Create a deprecated module attribute the first time it is accessed."""
+    factory = _DEPRECATED_ATTRIBUTE_FACTORIES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return globals().setdefault(name, factory())
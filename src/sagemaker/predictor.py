@@ -24,13 +24,20 @@ from sagemaker.session import Session
 
 # base_predictor was refactored from predictor.
 # this import ensures backward compatibility.
+from sagemaker import base_predictor
 from sagemaker.base_predictor import (  # noqa: F401 # pylint: disable=W0611
     Predictor,
     PredictorBase,
-    RealTimePredictor,
 )
 
 
+def __getattr__(name):
+    """Forward deprecated attributes, such as ``RealTimePredictor``, to ``base_predictor``."""
+    if name in base_predictor._DEPRECATED_ATTRIBUTE_FACTORIES:  # pylint: disable=W0212
+        return getattr(base_predictor, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def retrieve_default(
     endpoint_name: str,
     sagemaker_session: Session = DEFAULT_JUMPSTART_SAGEMAKER_SESSION,
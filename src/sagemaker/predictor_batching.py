@@ -0,0 +1,240 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Client-side request batching for real-time SageMaker endpoints."""
+from __future__ import absolute_import
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Optional
+
+from sagemaker.base_predictor import Predictor
+from sagemaker.deserializers import JSONDeserializer
+from sagemaker.jumpstart.types import JumpStartSerializablePayload
+from sagemaker.serializers import JSONSerializer
+
+_STOP = object()
+
+
+class BatchingPredictor(Predictor):
+    """Coalesce concurrent ``predict`` calls into batched endpoint invocations.
+
+    Each ``predict`` call is queued, and a background thread groups up to
+    ``max_batch_size`` inputs that arrive within ``max_batch_delay_ms`` of the
+    first one into a single ``InvokeEndpoint`` request. The serializer is given
+    the list of inputs, and the deserialized response must be a sequence with
+    exactly one prediction per input, in the same order. Each caller receives the
+    prediction for its own input.
+
+    Requests that set ``initial_args``, ``inference_id`` or ``custom_attributes``,
+    and JumpStart serializable payloads, are sent individually.
+    """
+
+    def __init__(
+        self,
+        endpoint_name,
+        sagemaker_session=None,
+        serializer=JSONSerializer(),
+        deserializer=JSONDeserializer(),
+        component_name=None,
+        max_batch_size: int = 32,
+        max_batch_delay_ms: float = 10,
+        batch_key_fn: Optional[Callable[[Any], Hashable]] = None,
+        **kwargs,
+    ):
+        """Initialize a ``BatchingPredictor``.
+
+        See :class:`~sagemaker.predictor.Predictor` for more info about parameters.
+
+        Args:
+            endpoint_name (str): Name of the Amazon SageMaker endpoint to which
+                requests are sent.
+            sagemaker_session (sagemaker.session.Session): A SageMaker Session
+                object, used for SageMaker interactions (default: None). If not
+                specified, one is created using the default AWS configuration
+                chain.
+            serializer (:class:`~sagemaker.serializers.BaseSerializer`): A
+                serializer object, used to encode a list of inputs for an inference
+                endpoint (default: :class:`~sagemaker.serializers.JSONSerializer`).
+            deserializer (:class:`~sagemaker.deserializers.BaseDeserializer`): A
+                deserializer object, used to decode a list of predictions from an
+                inference endpoint
+                (default: :class:`~sagemaker.deserializers.JSONDeserializer`).
+            component_name (str): Name of the Amazon SageMaker inference component
+                corresponding the predictor.
+            max_batch_size (int): The maximum number of inputs sent in a single
+                request (default: 32).
+            max_batch_delay_ms (float): The maximum time, in milliseconds, to wait
+                for more inputs after the first input of a batch arrives (default: 10).
+            batch_key_fn (Callable[[object], Hashable]): Optional. A function that maps
+                an input to a key. Only inputs with equal keys are batched together
+                (default: None).
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1. Got {max_batch_size}.")
+        if max_batch_delay_ms < 0:
+            raise ValueError(f"max_batch_delay_ms must not be negative. Got {max_batch_delay_ms}.")
+        super(BatchingPredictor, self).__init__(
+            endpoint_name,
+            sagemaker_session,
+            serializer,
+            deserializer,
+            component_name=component_name,
+            **kwargs,
+        )
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay_ms = max_batch_delay_ms
+        self.batch_key_fn = batch_key_fn
+        self._queue = queue.Queue()
+        self._batcher = None
+        self._batcher_lock = threading.Lock()
+
+    def predict(
+        self,
+        data,
+        initial_args=None,
+        target_model=None,
+        target_variant=None,
+        inference_id=None,
+        custom_attributes=None,
+        component_name: Optional[str] = None,
+    ):
+        """Return the inference for ``data``, batched with concurrent requests.
+
+        See :meth:`~sagemaker.predictor.Predictor.predict` for more info about parameters.
+
+        Returns:
+            object: The prediction for ``data``, taken from the deserialized response
+                of the batched request.
+        """
+        if (
+            initial_args
+            or inference_id
+            or custom_attributes
+            or isinstance(data, JumpStartSerializablePayload)
+        ):
+            return super(BatchingPredictor, self).predict(
+                data,
+                initial_args=initial_args,
+                target_model=target_model,
+                target_variant=target_variant,
+                inference_id=inference_id,
+                custom_attributes=custom_attributes,
+                component_name=component_name,
+            )
+
+        routing = (target_model, target_variant, component_name or self._get_component_name())
+        key = (routing, self.batch_key_fn(data) if self.batch_key_fn else None)
+        # Raise unhashable keys here rather than in the batching thread.
+        hash(key)
+        future = Future()
+        # Enqueue under the lock, so a concurrent ``close`` can't stop the thread
+        # between starting it and queueing this request.
+        with self._batcher_lock:
+            self._start_batcher()
+            self._queue.put((key, data, future))
+        return future.result()
+
+    def close(self):
+        """Stop the background batching thread after pending requests are sent.
+
+        The thread is started again by the next call to ``predict``.
+        """
+        with self._batcher_lock:
+            batcher = self._batcher
+            if batcher is None:
+                return
+            self._queue.put(_STOP)
+            batcher.join()
+            self._batcher = None
+
+    def _start_batcher(self):
+        """Start the background batching thread if it is not running.
+
+        Must be called with ``_batcher_lock`` held.
+        """
+        if self._batcher is None:
+            self._batcher = threading.Thread(
+                target=self._run_batcher, name="sagemaker-batching-predictor", daemon=True
+            )
+            self._batcher.start()
+
+    def _run_batcher(self):
+        """Drain the request queue into batches until ``close`` is called."""
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    return
+
+                pending = [item]
+                stop = False
+                deadline = time.monotonic() + self.max_batch_delay_ms / 1000.0
+                while len(pending) < self.max_batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                        break
+                    pending.append(item)
+
+                try:
+                    self._send_batches(pending)
+                except Exception as e:  # pylint: disable=broad-except
+                    for _, _, future in pending:
+                        if not future.done():
+                            future.set_exception(e)
+
+                if stop:
+                    return
+        finally:
+            # Let the next ``predict`` call start a new thread if this one exits.
+            if self._batcher is threading.current_thread():
+                self._batcher = None
+
+    def _send_batches(self, pending):
+        """Group queued requests by key and send one request per group."""
+        batches = {}
+        for key, data, future in pending:
+            batches.setdefault(key, []).append((data, future))
+        for (routing, _), requests in batches.items():
+            self._invoke_batch(routing, requests)
+
+    def _invoke_batch(self, routing, requests):
+        """Send one batched request and hand each prediction to its caller."""
+        target_model, target_variant, component_name = routing
+        try:
+            predictions = super(BatchingPredictor, self).predict(
+                [data for data, _ in requests],
+                target_model=target_model,
+                target_variant=target_variant,
+                component_name=component_name,
+            )
+            if len(predictions) != len(requests):
+                raise ValueError(
+                    f"Expected {len(requests)} predictions in the batched response "
+                    f"from endpoint {self.endpoint_name}, got {len(predictions)}."
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            for _, future in requests:
+                future.set_exception(e)
+            return
+
+        for (_, future), prediction in zip(requests, predictions):
+            future.set_result(prediction)
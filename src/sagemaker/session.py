@@ -199,7 +199,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             sagemaker_runtime_client (boto3.SageMakerRuntime.Client): Client which makes
                 ``InvokeEndpoint`` calls to Amazon SageMaker (default: None). Predictors created
                 using this ``Session`` use this client. If not provided, one will be created using
-                this instance's ``boto_session``.
+                this instance's ``boto_session``, with TCP keep-alive enabled. To use different
+                connection settings, pass a client created with your own
+                ``botocore.config.Config``.
             sagemaker_featurestore_runtime_client (boto3.SageMakerFeatureStoreRuntime.Client):
                 Client which makes SageMaker FeatureStore record related calls to Amazon SageMaker
                 (default: None). If not provided, one will be created using
@@ -290,7 +292,8 @@ class Session(object):  # pylint: disable=too-many-public-methods
         if sagemaker_runtime_client is not None:
             self.sagemaker_runtime_client = sagemaker_runtime_client
         else:
-            config = botocore.config.Config(read_timeout=80)
+            # Keep idle pooled connections alive so bursty traffic reuses TLS sessions.
+            config = botocore.config.Config(read_timeout=80, tcp_keepalive=True)
             self.sagemaker_runtime_client = self.boto_session.client(
                 "runtime.sagemaker", config=config
             )
@@ -51,6 +51,11 @@ def determine_prefix(user_agent=""):
 
 def prepend_user_agent(client):
     """Placeholder docstring"""
+    # Clients can be shared by several sessions, so only add the prefix once.
+    user_agent = client._client_config.user_agent
+    if isinstance(user_agent, str) and user_agent.startswith("AWS-SageMaker-Python-SDK/"):
+        return
+
     prefix = determine_prefix(client._client_config.user_agent)
 
     if client._client_config.user_agent is None:
@@ -12,14 +12,21 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 
+import asyncio
+import contextlib
 import io
 import json
+import logging
+import sys
 
+import botocore.config
 import pytest
-from mock import Mock, call, patch
+from botocore.credentials import ReadOnlyCredentials
+from mock import ANY, AsyncMock, Mock, call, patch
 
 from sagemaker.deserializers import CSVDeserializer, PandasDeserializer
 from sagemaker.enums import EndpointType
+from sagemaker.jumpstart.types import JumpStartSerializablePayload
 from sagemaker.model_monitor.model_monitoring import DEFAULT_REPOSITORY_NAME
 from sagemaker.predictor import Predictor
 from sagemaker.serializers import JSONSerializer, CSVSerializer
@@ -59,6 +66,98 @@ def empty_sagemaker_session():
     return ims
 
 
+def test_deprecated_init_kwargs():
+    sagemaker_session = empty_sagemaker_session()
+
+    predictor = Predictor(
+        endpoint_name=None, sagemaker_session=sagemaker_session, endpoint=ENDPOINT
+    )
+    assert predictor.endpoint_name == ENDPOINT
+
+    with pytest.warns(DeprecationWarning, match="content_type"):
+        Predictor(ENDPOINT, sagemaker_session, content_type="application/json")
+
+
+@patch("sagemaker.base_predictor._shared_session_clients", None)
+@patch("sagemaker.base_predictor.boto3")
+@patch("sagemaker.base_predictor.Session")
+def test_predictors_without_session_share_clients(session, boto3, monkeypatch):
+    monkeypatch.setenv("SAGEMAKER_MAX_POOL_CONNECTIONS", "20")
+
+    Predictor(ENDPOINT)
+    Predictor(ENDPOINT)
+
+    boto_session = boto3.DEFAULT_SESSION
+    assert boto_session.client.call_count == 2
+    for call_args, kwargs in boto_session.client.call_args_list:
+        assert kwargs["config"].max_pool_connections == 20
+        assert kwargs["config"].tcp_keepalive is True
+
+    assert session.call_count == 2
+    assert session.call_args_list[0] == session.call_args_list[1]
+    assert session.call_args.kwargs["boto_session"] is boto_session
+
+
+@patch("sagemaker.base_predictor._shared_session_clients", None)
+def test_shared_clients_follow_default_session_region():
+    import boto3
+
+    with patch("boto3.DEFAULT_SESSION", boto3.Session(region_name="eu-west-1")):
+        first = Predictor(ENDPOINT)
+        second = Predictor(ENDPOINT)
+
+    with patch("boto3.DEFAULT_SESSION", boto3.Session(region_name="ap-south-1")):
+        third = Predictor(ENDPOINT)
+
+    assert first.sagemaker_session.boto_region_name == "eu-west-1"
+    assert first.sagemaker_session.sagemaker_client is second.sagemaker_session.sagemaker_client
+    assert third.sagemaker_session.boto_region_name == "ap-south-1"
+    assert third.sagemaker_session.sagemaker_client.meta.region_name == "ap-south-1"
+    assert third.sagemaker_session.sagemaker_runtime_client.meta.region_name == "ap-south-1"
+
+
+@patch("sagemaker.base_predictor._shared_session_clients", None)
+def test_predictor_without_session_requires_region(monkeypatch, tmp_path):
+    import boto3
+
+    monkeypatch.delenv("AWS_DEFAULT_REGION", raising=False)
+    monkeypatch.delenv("AWS_REGION", raising=False)
+    monkeypatch.setenv("AWS_CONFIG_FILE", str(tmp_path / "config"))
+
+    with patch("boto3.DEFAULT_SESSION", boto3.Session()):
+        with pytest.raises(ValueError, match="Must setup local AWS configuration"):
+            Predictor(ENDPOINT)
+
+
+def test_deprecated_module_attributes_created_on_access():
+    from sagemaker import base_predictor, predictor
+
+    assert "json_deserializer" not in vars(base_predictor)
+
+    with pytest.warns(DeprecationWarning, match="json_deserializer"):
+        result = base_predictor.json_deserializer.deserialize(
+            io.BytesIO(b"[1, 2]"), "application/json"
+        )
+    assert result == [1, 2]
+    assert base_predictor.json_deserializer is base_predictor.json_deserializer
+
+    assert predictor.RealTimePredictor is base_predictor.RealTimePredictor
+    assert issubclass(predictor.RealTimePredictor, Predictor)
+
+    with pytest.raises(AttributeError):
+        predictor.not_an_attribute
+
+
+@patch("sagemaker.base_predictor.Predictor._endpoint_warned", False)
+@patch("sagemaker.base_predictor.renamed_warning")
+def test_deprecated_endpoint_attribute_warns_once(renamed_warning):
+    predictor = Predictor(ENDPOINT, empty_sagemaker_session())
+
+    assert predictor.endpoint == ENDPOINT
+    assert predictor.endpoint == ENDPOINT
+    renamed_warning.assert_called_once_with("The endpoint attribute")
+
+
 def test_predict_call_pass_through():
     sagemaker_session = empty_sagemaker_session()
     predictor = Predictor(ENDPOINT, sagemaker_session)
@@ -151,6 +250,317 @@ def test_multi_model_predict_call():
     assert result == RETURN_VALUE
 
 
+def test_predict_call_with_initial_args():
+    sagemaker_session = empty_sagemaker_session()
+    predictor = Predictor(ENDPOINT, sagemaker_session)
+
+    data = "untouched"
+    initial_args = {"ContentType": CSV_CONTENT_TYPE, "EndpointName": "other_endpoint"}
+    predictor.predict(data, initial_args=initial_args, target_model="model.tar.gz")
+
+    expected_request_args = {
+        "Accept": DEFAULT_ACCEPT,
+        "Body": data,
+        "ContentType": CSV_CONTENT_TYPE,
+        "EndpointName": "other_endpoint",
+        "TargetModel": "model.tar.gz",
+    }
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs == expected_request_args
+    assert initial_args == {"ContentType": CSV_CONTENT_TYPE, "EndpointName": "other_endpoint"}
+
+
+def test_predict_call_with_component_name():
+    sagemaker_session = empty_sagemaker_session()
+    predictor = Predictor(ENDPOINT, sagemaker_session, component_name="component-1")
+
+    data = "untouched"
+    predictor.predict(data)
+
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs["InferenceComponentName"] == "component-1"
+
+    predictor.predict(data, component_name="component-2")
+
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs["InferenceComponentName"] == "component-2"
+
+
+@patch.object(Predictor, "_get_component_name", return_value="component-3")
+def test_predict_entry_points_use_get_component_name(get_component_name):
+    sagemaker_session = empty_sagemaker_session()
+    invoke_endpoint = sagemaker_session.sagemaker_runtime_client.invoke_endpoint
+    predictor = Predictor(ENDPOINT, sagemaker_session)
+
+    predictor.predict("payload")
+    assert invoke_endpoint.call_args.kwargs["InferenceComponentName"] == "component-3"
+
+    predictor.predict("payload", target_variant=PRODUCTION_VARIANT_1)
+    assert invoke_endpoint.call_args.kwargs["InferenceComponentName"] == "component-3"
+
+    predictor.predict_raw(b"payload")
+    assert invoke_endpoint.call_args.kwargs["InferenceComponentName"] == "component-3"
+
+
+def test_predict_raw():
+    sagemaker_session = empty_sagemaker_session()
+    predictor = Predictor(ENDPOINT, sagemaker_session, serializer=JSONSerializer())
+
+    body = b"\x93NUMPY"
+    result = predictor.predict_raw(
+        body, content_type="application/x-npy", target_variant=PRODUCTION_VARIANT_1
+    )
+
+    expected_request_args = {
+        "Accept": DEFAULT_ACCEPT,
+        "Body": body,
+        "ContentType": "application/x-npy",
+        "EndpointName": ENDPOINT,
+        "TargetVariant": PRODUCTION_VARIANT_1,
+    }
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs == expected_request_args
+    assert result == RETURN_VALUE
+
+    predictor.predict_raw("1,2")
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs["Body"] == "1,2"
+    assert kwargs["ContentType"] == "application/json"
+
+
+def test_predict_stream():
+    sagemaker_session = ret_csv_sagemaker_session()
+    predictor = Predictor(ENDPOINT, sagemaker_session, serializer=CSVSerializer())
+
+    stream, content_type = predictor.predict_stream([1, 2], target_model="model.tar.gz")
+
+    expected_request_args = {
+        "Accept": DEFAULT_ACCEPT,
+        "Body": "1,2",
+        "ContentType": CSV_CONTENT_TYPE,
+        "EndpointName": ENDPOINT,
+        "TargetModel": "model.tar.gz",
+    }
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs == expected_request_args
+    assert content_type == CSV_CONTENT_TYPE
+    assert stream.read() == CSV_RETURN_VALUE.encode("utf-8")
+
+
+class AsyncResponseBody(object):
+    def __init__(self, body):
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def read(self):
+        return self.body
+
+
+def mock_aiobotocore():
+    """Return a fake ``aiobotocore.session`` module and the clients it creates."""
+    clients = []
+
+    @contextlib.asynccontextmanager
+    async def create_client(*args, **kwargs):
+        client = Mock(name="async_sagemaker_runtime", closed=False)
+        client.invoke_endpoint = AsyncMock(
+            side_effect=lambda **kwargs: {
+                "Body": AsyncResponseBody(b"response"),
+                "ContentType": "text/plain",
+            }
+        )
+        clients.append(client)
+        yield client
+        client.closed = True
+
+    aio_session = Mock(create_client=Mock(side_effect=create_client))
+    return Mock(get_session=Mock(return_value=aio_session)), aio_session, clients
+
+
+def test_predict_async():
+    sagemaker_session = empty_sagemaker_session()
+    predictor = Predictor(ENDPOINT, sagemaker_session, serializer=JSONSerializer())
+    aiobotocore_session, _, clients = mock_aiobotocore()
+
+    async def predict_and_close():
+        result = await predictor.predict_async([1, 2], target_variant=PRODUCTION_VARIANT_1)
+        await predictor.close_async()
+        return result
+
+    with patch.dict(sys.modules, {"aiobotocore.session": aiobotocore_session}):
+        result = asyncio.run(predict_and_close())
+
+    assert result == b"response"
+    clients[0].invoke_endpoint.assert_awaited_once_with(
+        EndpointName=ENDPOINT,
+        ContentType="application/json",
+        Accept=DEFAULT_ACCEPT,
+        TargetVariant=PRODUCTION_VARIANT_1,
+        Body="[1, 2]",
+    )
+    sagemaker_session.sagemaker_runtime_client.invoke_endpoint.assert_not_called()
+    assert clients[0].closed
+    assert predictor._async_runtime_client is None
+
+
+def test_predict_async_without_aiobotocore():
+    predictor = Predictor(ENDPOINT, empty_sagemaker_session())
+
+    with patch.dict(sys.modules, {"aiobotocore.session": None}):
+        with pytest.raises(ImportError, match="aiobotocore"):
+            asyncio.run(predictor.predict_async(b"payload"))
+
+
+def test_predict_async_client_uses_session_credentials_and_endpoint():
+    sagemaker_session = empty_sagemaker_session()
+    sagemaker_session.boto_session.profile_name = "my-profile"
+    sagemaker_session.boto_region_name = "us-west-2"
+    sagemaker_session.boto_session.get_credentials.return_value.get_frozen_credentials.return_value = Mock(
+        access_key="access-key", secret_key="secret-key", token="session-token"
+    )
+    sagemaker_session.sagemaker_runtime_client.meta.endpoint_url = "https://runtime.example.com"
+    predictor = Predictor(ENDPOINT, sagemaker_session)
+    aiobotocore_session, aio_session, _ = mock_aiobotocore()
+
+    with patch.dict(sys.modules, {"aiobotocore.session": aiobotocore_session}):
+        assert asyncio.run(predictor.predict_async(b"payload")) == b"response"
+
+    aio_session.create_client.assert_called_once_with(
+        "sagemaker-runtime",
+        region_name="us-west-2",
+        endpoint_url="https://runtime.example.com",
+        config=ANY,
+        aws_access_key_id="access-key",
+        aws_secret_access_key="secret-key",
+        aws_session_token="session-token",
+    )
+    aio_session.set_config_variable.assert_not_called()
+
+
+def test_predict_async_recreates_client_when_credentials_change():
+    sagemaker_session = empty_sagemaker_session()
+    get_frozen_credentials = (
+        sagemaker_session.boto_session.get_credentials.return_value.get_frozen_credentials
+    )
+    predictor = Predictor(ENDPOINT, sagemaker_session)
+    aiobotocore_session, aio_session, clients = mock_aiobotocore()
+
+    async def predict_with_rotated_credentials():
+        get_frozen_credentials.return_value = ReadOnlyCredentials("key", "secret", "token-1")
+        await predictor.predict_async(b"payload")
+        await predictor.predict_async(b"payload")
+        get_frozen_credentials.return_value = ReadOnlyCredentials("key", "secret", "token-2")
+        await predictor.predict_async(b"payload")
+        assert not clients[0].closed
+        await predictor.close_async()
+
+    with patch.dict(sys.modules, {"aiobotocore.session": aiobotocore_session}):
+        asyncio.run(predict_with_rotated_credentials())
+
+    assert aio_session.create_client.call_count == 2
+    assert clients[0].invoke_endpoint.await_count == 2
+    assert clients[1].invoke_endpoint.await_count == 1
+    assert clients[0].closed and clients[1].closed
+
+
+def test_predict_async_across_event_loops():
+    predictor = Predictor(ENDPOINT, empty_sagemaker_session())
+    aiobotocore_session, aio_session, clients = mock_aiobotocore()
+
+    with patch.dict(sys.modules, {"aiobotocore.session": aiobotocore_session}):
+        assert asyncio.run(predictor.predict_async(b"payload")) == b"response"
+        assert asyncio.run(predictor.predict_async(b"payload")) == b"response"
+
+    assert aio_session.create_client.call_count == 2
+    assert clients[1].invoke_endpoint.await_count == 1
+
+
+def test_predict_async_local_mode_not_supported():
+    sagemaker_session = empty_sagemaker_session()
+    sagemaker_session.sagemaker_runtime_client = Mock(spec=["invoke_endpoint"])
+    predictor = Predictor(ENDPOINT, sagemaker_session)
+
+    with pytest.raises(ValueError, match="local mode"):
+        asyncio.run(predictor.predict_async(b"payload"))
+
+
+def test_predict_call_with_runtime_client_config():
+    sagemaker_session = empty_sagemaker_session()
+    sagemaker_session.local_mode = False
+    session_config = botocore.config.Config(read_timeout=80)
+    sagemaker_session.sagemaker_runtime_client.meta.config = session_config
+    runtime_client = Mock(name="dedicated_sagemaker_runtime")
+    runtime_client._client_config.user_agent = "Boto3/1.0"
+    runtime_client.invoke_endpoint = Mock(return_value={"Body": io.BytesIO(b"response")})
+    sagemaker_session.boto_session.client = Mock(return_value=runtime_client)
+
+    predictor = Predictor(
+        ENDPOINT,
+        sagemaker_session,
+        runtime_client_config=botocore.config.Config(max_pool_connections=50),
+    )
+    result = predictor.predict("payload")
+
+    call_args, kwargs = sagemaker_session.boto_session.client.call_args
+    assert call_args == ("runtime.sagemaker",)
+    assert kwargs["config"].max_pool_connections == 50
+    assert kwargs["config"].read_timeout == 80
+    assert kwargs["config"].tcp_keepalive is True
+    runtime_client.invoke_endpoint.assert_called_once()
+    sagemaker_session.sagemaker_runtime_client.invoke_endpoint.assert_not_called()
+    assert result == b"response"
+
+
+def test_runtime_client_config_recreates_client_for_new_session():
+    def runtime_config_session():
+        sagemaker_session = empty_sagemaker_session()
+        sagemaker_session.local_mode = False
+        runtime_client = sagemaker_session.boto_session.client.return_value
+        runtime_client._client_config.user_agent = "Boto3/1.0"
+        runtime_client.invoke_endpoint = Mock(return_value={"Body": io.BytesIO(b"response")})
+        return sagemaker_session
+
+    predictor = Predictor(
+        ENDPOINT,
+        runtime_config_session(),
+        runtime_client_config=botocore.config.Config(max_pool_connections=50),
+    )
+    predictor.predict("payload")
+
+    other_session = runtime_config_session()
+    predictor.sagemaker_session = other_session
+    predictor.predict("payload")
+
+    other_session.boto_session.client.return_value.invoke_endpoint.assert_called_once()
+    assert other_session.boto_session.client.call_args.kwargs["config"].max_pool_connections == 50
+
+
+def test_runtime_client_config_not_supported_in_local_mode():
+    sagemaker_session = empty_sagemaker_session()
+    sagemaker_session.local_mode = True
+
+    with pytest.raises(ValueError, match="local mode"):
+        Predictor(
+            ENDPOINT,
+            sagemaker_session,
+            runtime_client_config=botocore.config.Config(max_pool_connections=50),
+        )
+    sagemaker_session.boto_session.client.assert_not_called()
+
+
+def test_predictor_init_does_not_read_runtime_client():
+    sagemaker_session = Mock(spec=["sagemaker_client", "boto_region_name"])
+
+    predictor = Predictor(ENDPOINT, sagemaker_session)
+
+    assert predictor.sagemaker_session is sagemaker_session
+
+
 def json_sagemaker_session():
     ims = Mock(
         name="sagemaker_session",
@@ -390,6 +800,34 @@ def test_update_endpoint_instance_type_and_count(name_from_base, production_vari
     )
 
 
+@patch("sagemaker.base_predictor.production_variant")
+@patch("sagemaker.base_predictor.name_from_base")
+def test_update_endpoint_managed_instance_scaling(name_from_base, production_variant):
+    name_from_base.return_value = "new-endpoint-config"
+
+    sagemaker_session = empty_sagemaker_session()
+    existing_model_name = "existing-model"
+
+    predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session)
+    predictor._endpoint_config_name = "existing-endpoint-config"
+    predictor._model_names = [existing_model_name]
+
+    predictor.update_endpoint(
+        initial_instance_count=2,
+        instance_type="ml.c4.xlarge",
+        max_instance_count=4,
+        min_instance_count=1,
+    )
+
+    production_variant.assert_called_with(
+        existing_model_name,
+        "ml.c4.xlarge",
+        initial_instance_count=2,
+        accelerator_type=None,
+        managed_instance_scaling={"MaxInstanceCount": 4, "MinInstanceCount": 1},
+    )
+
+
 def test_update_endpoint_no_instance_type_or_no_instance_count():
     sagemaker_session = empty_sagemaker_session()
     predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session)
@@ -413,6 +851,23 @@ def test_update_endpoint_no_one_default_model_name_with_instance_type_and_count(
     assert "Unable to choose a default model for a new EndpointConfig" in str(exception.value)
 
 
+def test_get_model_names_memoized_after_success():
+    sagemaker_session = empty_sagemaker_session()
+    describe_endpoint_config = sagemaker_session.sagemaker_client.describe_endpoint_config
+    describe_endpoint_config.side_effect = [Exception("Throttled."), ENDPOINT_CONFIG_DESC]
+    predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session)
+
+    with pytest.raises(Exception, match="Throttled."):
+        predictor._get_model_names()
+
+    assert predictor._get_model_names() == ["model-1", "model-2"]
+    assert predictor._get_model_names() == ["model-1", "model-2"]
+    assert describe_endpoint_config.call_count == 2
+    sagemaker_session.sagemaker_client.describe_endpoint.assert_called_once_with(
+        EndpointName=ENDPOINT
+    )
+
+
 def test_delete_endpoint_with_config():
     sagemaker_session = empty_sagemaker_session()
     sagemaker_session.sagemaker_client.describe_endpoint = Mock(
@@ -434,6 +889,44 @@ def test_delete_endpoint_only():
     sagemaker_session.delete_endpoint_config.assert_not_called()
 
 
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_related_models(prefetch):
+    sagemaker_session = empty_sagemaker_session()
+    sagemaker_session.list_inference_components = Mock(
+        side_effect=[
+            {
+                "InferenceComponents": [
+                    {"InferenceComponentName": "component-1"},
+                    {"InferenceComponentName": "component-2"},
+                ],
+                "NextToken": "token-1",
+            },
+            {"InferenceComponents": [{"InferenceComponentName": "component-3"}]},
+        ]
+    )
+    predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session)
+
+    models = predictor.iter_related_models(prefetch=prefetch, status_equals="InService")
+
+    assert [model["InferenceComponentName"] for model in models] == [
+        "component-1",
+        "component-2",
+        "component-3",
+    ]
+    assert sagemaker_session.list_inference_components.call_args_list == [
+        call(endpoint_name_equals=ENDPOINT, next_token=None, status_equals="InService"),
+        call(endpoint_name_equals=ENDPOINT, next_token="token-1", status_equals="InService"),
+    ]
+
+
+def test_iter_related_models_empty_inference_components():
+    sagemaker_session = empty_sagemaker_session()
+    sagemaker_session.list_inference_components = Mock(return_value={})
+    predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session)
+
+    assert list(predictor.iter_related_models()) == []
+
+
 def test_delete_model():
     sagemaker_session = empty_sagemaker_session()
     predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session)
@@ -443,7 +936,22 @@ def test_delete_model():
     expected_call_count = 2
     expected_call_args_list = [call("model-1"), call("model-2")]
     assert sagemaker_session.delete_model.call_count == expected_call_count
-    assert sagemaker_session.delete_model.call_args_list == expected_call_args_list
+    sagemaker_session.delete_model.assert_has_calls(expected_call_args_list, any_order=True)
+
+
+def test_delete_model_reports_failed_models():
+    sagemaker_session = empty_sagemaker_session()
+
+    def delete_model(model_name):
+        if model_name == "model-2":
+            raise Exception("Could not find model.")
+
+    sagemaker_session.delete_model = Mock(side_effect=delete_model)
+    predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session)
+
+    with pytest.raises(Exception, match="Failed models: model-2$"):
+        predictor.delete_model()
+    assert sagemaker_session.delete_model.call_count == 2
 
 
 def test_delete_model_fail():
@@ -496,6 +1004,31 @@ def test_endpoint_context_success():
     context = pdctr.endpoint_context()
 
     assert context
+    session.sagemaker_client.list_contexts.assert_called_once_with(SourceUri="foo", MaxResults=1)
+
+
+@patch("sagemaker.base_predictor.name_from_base")
+def test_describe_endpoint_shared_until_endpoint_update(name_from_base):
+    name_from_base.return_value = "new-endpoint-config"
+    session = context_sagemaker_session()
+    describe_endpoint = session.sagemaker_client.describe_endpoint
+    pdctr = Predictor(ENDPOINT, sagemaker_session=session)
+
+    assert pdctr.endpoint_context()
+    pdctr._get_endpoint_config_name()
+    describe_endpoint.assert_called_once_with(EndpointName=ENDPOINT)
+
+    pdctr.update_data_capture_config(data_capture_config=None)
+    assert describe_endpoint.call_count == 2
+    session.create_endpoint_config_from_existing.assert_called_with(
+        existing_config_name=ENDPOINT,
+        new_config_name="new-endpoint-config",
+        new_data_capture_config_dict=None,
+    )
+
+    assert pdctr._get_endpoint_config_name() == "new-endpoint-config"
+    pdctr._describe_endpoint()
+    assert describe_endpoint.call_count == 3
 
 
 def test_endpoint_context_fail():
@@ -542,45 +1075,73 @@ def test_list_monitors(default_model_monitor_attach, *attach_methods):
             ]
         }
     )
-    sagemaker_session.describe_monitoring_schedule = Mock(
-        side_effect=[
-            {
-                "MonitoringScheduleConfig": {
-                    "MonitoringJobDefinition": {
-                        "MonitoringAppSpecification": {
-                            "ImageUri": DEFAULT_REPOSITORY_NAME,
-                        }
+    schedules = {
+        "default-monitor": {
+            "MonitoringScheduleConfig": {
+                "MonitoringJobDefinition": {
+                    "MonitoringAppSpecification": {
+                        "ImageUri": DEFAULT_REPOSITORY_NAME,
                     }
                 }
-            },
-            {
-                "MonitoringScheduleConfig": {
-                    "MonitoringJobDefinition": {
-                        "MonitoringAppSpecification": {
-                            "ImageUri": "byoc-image",
-                        }
+            }
+        },
+        "byoc-monitor": {
+            "MonitoringScheduleConfig": {
+                "MonitoringJobDefinition": {
+                    "MonitoringAppSpecification": {
+                        "ImageUri": "byoc-image",
                     }
                 }
-            },
-            {
-                "MonitoringScheduleConfig": {
-                    "MonitoringType": "DataQuality",
-                    "MonitoringJobDefinitionName": "data-quality-job-definition",
-                }
-            },
-            {
-                "MonitoringScheduleConfig": {
-                    "MonitoringType": "ModelQuality",
-                    "MonitoringJobDefinitionName": "model-quality-job-definition",
-                }
-            },
-        ]
+            }
+        },
+        "data-quality-monitor": {
+            "MonitoringScheduleConfig": {
+                "MonitoringType": "DataQuality",
+                "MonitoringJobDefinitionName": "data-quality-job-definition",
+            }
+        },
+        "model-quality-monitor": {
+            "MonitoringScheduleConfig": {
+                "MonitoringType": "ModelQuality",
+                "MonitoringJobDefinitionName": "model-quality-job-definition",
+            }
+        },
+    }
+    sagemaker_session.describe_monitoring_schedule = Mock(
+        side_effect=lambda monitoring_schedule_name: schedules[monitoring_schedule_name]
     )
+    for attach_method in (default_model_monitor_attach,) + attach_methods:
+        attach_method.side_effect = lambda monitor_schedule_name, sagemaker_session: (
+            monitor_schedule_name
+        )
+
     predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session)
-    predictor.list_monitors()
+    monitors = predictor.list_monitors()
+
+    assert monitors == [
+        "default-monitor",
+        "byoc-monitor",
+        "data-quality-monitor",
+        "model-quality-monitor",
+        "model-bias-monitor",
+        "model-explainability-monitor",
+    ]
     for attach_method in attach_methods:
         attach_method.assert_called_once()
     assert default_model_monitor_attach.call_count == 2
+    assert sagemaker_session.describe_monitoring_schedule.call_count == 4
+
+
+def test_list_monitors_no_monitors(caplog):
+    sagemaker_session = empty_sagemaker_session()
+    sagemaker_session.list_monitoring_schedules = Mock(
+        return_value={"MonitoringScheduleSummaries": []}
+    )
+    predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session)
+
+    with caplog.at_level(logging.INFO, logger="sagemaker"):
+        assert predictor.list_monitors() == []
+    assert f"No monitors found for endpoint. endpoint: {ENDPOINT}" in caplog.text
 
 
 def test_list_monitors_unknown_monitoring_type():
@@ -621,6 +1182,164 @@ def test_setting_serializer_deserializer_atts_changes_content_accept_types():
     assert predictor.content_type == "text/csv"
 
 
+def test_setting_content_accept_types_changes_request_headers():
+    sagemaker_session = empty_sagemaker_session()
+    predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session)
+
+    predictor.predict("payload")
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs["ContentType"] == DEFAULT_CONTENT_TYPE
+    assert kwargs["Accept"] == DEFAULT_ACCEPT
+
+    predictor.serializer = CSVSerializer()
+    predictor.predict("payload")
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs["ContentType"] == CSV_CONTENT_TYPE
+    assert kwargs["Accept"] == DEFAULT_ACCEPT
+
+    predictor.content_type = "application/json"
+    predictor.accept = ("application/json", "text/csv")
+    predictor.predict("payload")
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs["ContentType"] == "application/json"
+    assert kwargs["Accept"] == "application/json, text/csv"
+
+
+def test_predict_serializes_with_current_serializer():
+    sagemaker_session = empty_sagemaker_session()
+    predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session, component_name="component")
+
+    predictor.predict("payload")
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs == {
+        "Accept": DEFAULT_ACCEPT,
+        "Body": "payload",
+        "ContentType": DEFAULT_CONTENT_TYPE,
+        "EndpointName": ENDPOINT,
+        "InferenceComponentName": "component",
+    }
+
+    predictor.serializer = JSONSerializer()
+    predictor.predict({"a": 1})
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs["Body"] == '{"a": 1}'
+    assert kwargs["ContentType"] == "application/json"
+
+
+def test_predict_uses_subclass_request_args():
+    class TaggingPredictor(Predictor):
+        def _create_request_args(self, *args, **kwargs):
+            request_args = super(TaggingPredictor, self)._create_request_args(*args, **kwargs)
+            request_args["CustomAttributes"] = "tagged"
+            return request_args
+
+    sagemaker_session = empty_sagemaker_session()
+    predictor = TaggingPredictor(ENDPOINT, sagemaker_session=sagemaker_session)
+
+    predictor.predict("payload")
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs["CustomAttributes"] == "tagged"
+
+
+def test_prediction_cache():
+    sagemaker_session = json_sagemaker_session()
+    predictor = Predictor(ENDPOINT, sagemaker_session, serializer=JSONSerializer())
+    invoke_endpoint = sagemaker_session.sagemaker_runtime_client.invoke_endpoint
+
+    assert predictor.prediction_cache_stats() is None
+    predictor.enable_prediction_cache(max_entries=1)
+
+    first = predictor.predict([1, 2])
+    second = predictor.predict([1, 2])
+    assert first == second
+    assert invoke_endpoint.call_count == 1
+
+    predictor.predict([1, 2], target_variant=PRODUCTION_VARIANT_1)
+    assert invoke_endpoint.call_count == 2
+
+    predictor.predict([1, 2])
+    assert invoke_endpoint.call_count == 3
+
+    assert predictor.prediction_cache_stats() == {
+        "hits": 1,
+        "misses": 3,
+        "entries": 1,
+        "max_entries": 1,
+    }
+
+    predictor.disable_prediction_cache()
+    predictor.predict([1, 2])
+    assert invoke_endpoint.call_count == 4
+    assert predictor.prediction_cache_stats() is None
+
+
+def test_prediction_cache_skips_non_idempotent_requests():
+    sagemaker_session = json_sagemaker_session()
+    predictor = Predictor(ENDPOINT, sagemaker_session, serializer=JSONSerializer())
+    invoke_endpoint = sagemaker_session.sagemaker_runtime_client.invoke_endpoint
+    predictor.enable_prediction_cache()
+
+    predictor.predict([1, 2], inference_id=INFERENCE_ID)
+    predictor.predict([1, 2], inference_id=INFERENCE_ID)
+    predictor.predict([1, 2], custom_attributes="custom-attribute")
+    predictor.predict([1, 2], initial_args={"CustomAttributes": "custom-attribute"})
+
+    assert invoke_endpoint.call_count == 4
+    assert predictor.prediction_cache_stats()["entries"] == 0
+
+    with pytest.raises(ValueError):
+        predictor.enable_prediction_cache(max_entries=0)
+
+
+@patch("sagemaker.base_predictor.get_jumpstart_content_bucket")
+def test_jumpstart_payload_serializer_reused(get_jumpstart_content_bucket):
+    get_jumpstart_content_bucket.return_value = BUCKET_NAME
+    sagemaker_session = empty_sagemaker_session()
+    sagemaker_session._region_name = "us-west-2"
+    predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session)
+    payload = JumpStartSerializablePayload(
+        {"content_type": "application/json", "accept": "application/json", "body": {"a": 1}}
+    )
+
+    predictor.predict(payload)
+    predictor.predict(payload)
+
+    get_jumpstart_content_bucket.assert_called_once_with("us-west-2")
+    call_args, kwargs = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args
+    assert kwargs == {
+        "Accept": "application/json",
+        "Body": '{"a": 1}',
+        "ContentType": "application/json",
+        "EndpointName": ENDPOINT,
+    }
+
+    sagemaker_session.s3_client = Mock(name="s3_client")
+    predictor.predict(payload)
+    assert get_jumpstart_content_bucket.call_count == 2
+
+
+def test_predict_reuses_invoke_endpoint_until_runtime_client_changes():
+    sagemaker_session = empty_sagemaker_session()
+    predictor = Predictor(ENDPOINT, sagemaker_session)
+
+    predictor.predict("payload")
+    invoke_endpoint = predictor._invoke_endpoint
+    predictor.predict("payload")
+    assert predictor._invoke_endpoint is invoke_endpoint
+
+    sagemaker_session.sagemaker_runtime_client = empty_sagemaker_session().sagemaker_runtime_client
+    predictor.predict("payload")
+    predictor.predict("payload", target_variant=PRODUCTION_VARIANT_1)
+
+    assert sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_count == 2
+
+    other_session = empty_sagemaker_session()
+    predictor.sagemaker_session = other_session
+    predictor.predict("payload")
+
+    other_session.sagemaker_runtime_client.invoke_endpoint.assert_called_once()
+
+
 def test_custom_attributes():
     sagemaker_session = empty_sagemaker_session()
     predictor = Predictor(ENDPOINT, sagemaker_session=sagemaker_session)
@@ -669,6 +1388,24 @@ def test_update_predictor():
     sagemaker_session.update_inference_component.assert_called_with(**request)
 
 
+def test_update_predictor_without_resources():
+    sagemaker_session = empty_sagemaker_session()
+    component_name = "test_component_name"
+    predictor = Predictor(
+        ENDPOINT, sagemaker_session=sagemaker_session, component_name=component_name
+    )
+
+    predictor.update_predictor(image_uri="my-image", model_data_download_timeout=600)
+
+    sagemaker_session.update_inference_component.assert_called_with(
+        inference_component_name=component_name,
+        specification={
+            "Container": {"Image": "my-image"},
+            "StartupParameters": {"ModelDataDownloadTimeoutInSeconds": 600},
+        },
+    )
+
+
 def test_list_related_models_empty_inference_components():
     sagemaker_session = empty_sagemaker_session()
     sagemaker_session.list_inference_components = Mock(return_value={})
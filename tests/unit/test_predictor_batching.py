@@ -0,0 +1,173 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import io
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from mock import Mock
+
+from sagemaker.predictor_batching import _STOP, BatchingPredictor
+
+ENDPOINT = "mxnet_endpoint"
+BUCKET_NAME = "mxnet_endpoint"
+LONG_BATCH_DELAY_MS = 5000
+
+
+def echo_invoke_endpoint(**kwargs):
+    return {"Body": io.BytesIO(kwargs["Body"].encode("utf-8")), "ContentType": "application/json"}
+
+
+def empty_sagemaker_session(invoke_endpoint=echo_invoke_endpoint):
+    ims = Mock(
+        name="sagemaker_session",
+        default_bucket_prefix=None,
+    )
+    ims.default_bucket = Mock(name="default_bucket", return_value=BUCKET_NAME)
+    ims.sagemaker_runtime_client = Mock(name="sagemaker_runtime")
+    ims.sagemaker_runtime_client.invoke_endpoint = Mock(
+        name="invoke_endpoint", side_effect=invoke_endpoint
+    )
+    return ims
+
+
+def predict_concurrently(predictor, inputs, **kwargs):
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        futures = [executor.submit(predictor.predict, data, **kwargs) for data in inputs]
+        return [future.result() for future in futures]
+
+
+def test_batching_predictor_coalesces_concurrent_requests():
+    sagemaker_session = empty_sagemaker_session()
+    predictor = BatchingPredictor(
+        ENDPOINT,
+        sagemaker_session,
+        max_batch_size=4,
+        max_batch_delay_ms=LONG_BATCH_DELAY_MS,
+    )
+
+    inputs = [[1], [2], [3], [4]]
+    results = predict_concurrently(predictor, inputs)
+    predictor.close()
+
+    assert results == inputs
+    invoke_endpoint = sagemaker_session.sagemaker_runtime_client.invoke_endpoint
+    invoke_endpoint.assert_called_once()
+    call_args, kwargs = invoke_endpoint.call_args
+    assert sorted(json.loads(kwargs["Body"])) == inputs
+    assert kwargs["ContentType"] == "application/json"
+    assert kwargs["EndpointName"] == ENDPOINT
+
+
+def test_batching_predictor_batches_by_target_model():
+    sagemaker_session = empty_sagemaker_session()
+    predictor = BatchingPredictor(ENDPOINT, sagemaker_session, max_batch_delay_ms=0)
+
+    assert predictor.predict(1, target_model="model-1.tar.gz") == 1
+    assert predictor.predict(2, target_model="model-2.tar.gz") == 2
+    predictor.close()
+
+    call_args_list = sagemaker_session.sagemaker_runtime_client.invoke_endpoint.call_args_list
+    assert [kwargs["TargetModel"] for _, kwargs in call_args_list] == [
+        "model-1.tar.gz",
+        "model-2.tar.gz",
+    ]
+    assert [kwargs["Body"] for _, kwargs in call_args_list] == ["[1]", "[2]"]
+
+
+def test_batching_predictor_sends_custom_attributes_individually():
+    sagemaker_session = empty_sagemaker_session()
+    predictor = BatchingPredictor(ENDPOINT, sagemaker_session)
+
+    result = predictor.predict([1, 2], custom_attributes="custom-attribute")
+
+    assert result == [1, 2]
+    assert predictor._batcher is None
+    sagemaker_session.sagemaker_runtime_client.invoke_endpoint.assert_called_once_with(
+        EndpointName=ENDPOINT,
+        ContentType="application/json",
+        Accept="application/json",
+        CustomAttributes="custom-attribute",
+        Body="[1, 2]",
+    )
+
+
+def test_batching_predictor_response_length_mismatch():
+    def invoke_endpoint(**kwargs):
+        return {"Body": io.BytesIO(b"[]"), "ContentType": "application/json"}
+
+    sagemaker_session = empty_sagemaker_session(invoke_endpoint)
+    predictor = BatchingPredictor(ENDPOINT, sagemaker_session, max_batch_delay_ms=0)
+
+    with pytest.raises(ValueError, match="Expected 1 predictions"):
+        predictor.predict([1])
+    predictor.close()
+
+
+def test_batching_predictor_unhashable_batch_key():
+    predictor = BatchingPredictor(
+        ENDPOINT, empty_sagemaker_session(), max_batch_delay_ms=0, batch_key_fn=lambda x: x
+    )
+
+    with pytest.raises(TypeError):
+        predictor.predict([1])
+    assert predictor.predict(1) == 1
+    predictor.close()
+
+
+def test_batching_predictor_survives_batching_errors():
+    predictor = BatchingPredictor(ENDPOINT, empty_sagemaker_session(), max_batch_delay_ms=0)
+
+    predictor._send_batches = Mock(side_effect=RuntimeError("boom"))
+    with pytest.raises(RuntimeError, match="boom"):
+        predictor.predict([1])
+
+    del predictor._send_batches
+    assert predictor.predict([2]) == [2]
+    predictor.close()
+
+
+def test_batching_predictor_close_races_with_thread_exit_and_predict():
+    predictor = BatchingPredictor(ENDPOINT, empty_sagemaker_session(), max_batch_delay_ms=0)
+    assert predictor.predict(1) == 1
+    batcher = predictor._batcher
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        racing = []
+        queue_put = predictor._queue.put
+
+        def put(item):
+            queue_put(item)
+            if item is _STOP:
+                # The thread exits, and another predict starts, before close joins it.
+                batcher.join()
+                racing.append(executor.submit(predictor.predict, 2))
+                time.sleep(0.1)
+
+        predictor._queue.put = put
+        predictor.close()
+
+        assert racing[0].result(timeout=5) == 2
+    del predictor._queue.put
+    predictor.close()
+
+
+def test_batching_predictor_invalid_arguments():
+    with pytest.raises(ValueError):
+        BatchingPredictor(ENDPOINT, empty_sagemaker_session(), max_batch_size=0)
+
+    with pytest.raises(ValueError):
+        BatchingPredictor(ENDPOINT, empty_sagemaker_session(), max_batch_delay_ms=-1)
@@ -109,6 +109,19 @@ def test_new_session_created(boto3_session):
     assert sess.boto_session is boto3_session.return_value
 
 
+def test_sagemaker_runtime_client_uses_tcp_keepalive(boto_session):
+    Session(boto_session)
+
+    runtime_client_calls = [
+        kwargs
+        for args, kwargs in boto_session.client.call_args_list
+        if args == ("runtime.sagemaker",)
+    ]
+    assert len(runtime_client_calls) == 1
+    assert runtime_client_calls[0]["config"].read_timeout == 80
+    assert runtime_client_calls[0]["config"].tcp_keepalive is True
+
+
 def test_process(boto_session):
     session = Session(boto_session)
 
@@ -843,6 +856,20 @@ def test_user_agent_injected(boto_session):
     )
 
 
+def test_user_agent_injected_once_for_shared_clients(boto_session):
+    sess = Session(boto_session)
+    user_agent = sess.sagemaker_client._client_config.user_agent
+
+    Session(
+        boto_session,
+        sagemaker_client=sess.sagemaker_client,
+        sagemaker_runtime_client=sess.sagemaker_runtime_client,
+    )
+
+    assert sess.sagemaker_client._client_config.user_agent == user_agent
+    assert user_agent.count("AWS-SageMaker-Python-SDK") == 1
+
+
 def test_user_agent_injected_with_nbi(boto_session):
     assert (
         "AWS-SageMaker-Python-SDK" not in boto_session.client("sagemaker")._client_config.user_agent